@@ -7,109 +7,252 @@ It orchestrates the tax calculation workflow by loading sales data,
 applying tax rules, and generating comprehensive reports.
 """
 
-import csv
+import argparse
+import contextlib
+import multiprocessing
+import os
 import sys
 from datetime import datetime
-from tax_rules import TaxCalculator, TAX_RATES
+from functools import partial
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
-def load_sales_data(filename='sales_data.csv'):
+from tax_rules import CHUNK_SIZE, TAX_CATEGORY_CODES, TAX_RATES, TAX_RATES_ARRAY, load_sales_data
+
+
+# Column defaults for records missing a field
+SALES_DEFAULTS = {
+    'transaction_id': 'N/A',
+    'amount': 0.0,
+    'category': 'standard',
+}
+
+# Columns parsed from the CSV file, with their types; any other column is
+# skipped. amount stays text so invalid values can be reported per record
+# instead of failing the whole read
+SALES_COLUMN_TYPES = {
+    'transaction_id': pa.string(),
+    'amount': pa.string(),
+    'category': pa.dictionary(pa.int32(), pa.string()),
+}
+
+# Write buffer for the --report transaction log
+REPORT_BUFFER_SIZE = 1 << 20
+
+
+def category_codes(categories):
     """
-    Load sales data from CSV file.
+    Convert a column of category names to integer codes into TAX_RATES_ARRAY.
+    
+    Only the distinct category names are looked up; rows are then mapped
+    with a single array take. Unknown or missing categories get the
+    'standard' code.
     
     Args:
-        filename (str): Path to the CSV file containing sales data
+        categories (pandas.Series): Category name per record
         
     Returns:
-        list: List of dictionaries containing sales records
+        numpy.ndarray: int8 category code per record
     """
-    sales_data = []
+    categories = categories.astype('category')
+    lookup = (categories.cat.categories.map(TAX_CATEGORY_CODES.get).to_series()
+              .fillna(TAX_CATEGORY_CODES['standard']).to_numpy(dtype=np.int8))
+    # Missing values have pandas code -1, which picks the trailing 'standard' entry
+    lookup = np.append(lookup, np.int8(TAX_CATEGORY_CODES['standard']))
+    return np.take(lookup, categories.cat.codes.to_numpy())
+
+
+def parse_amounts(amounts):
+    """
+    Convert a column of amounts to float64 in one pass.
+    
+    Text amounts are cast with a single Arrow call. Only if that fails is
+    the column re-parsed leniently to find the invalid values. Null
+    amounts count as 0. The CSV reader yields an empty amount field as ''
+    rather than null, so empty amounts are reported as invalid, like any
+    other non-numeric text.
+    
+    Args:
+        amounts (pandas.Series): Amount per record, as text or numbers
+        
+    Returns:
+        tuple: (float64 numpy.ndarray of amounts, boolean mask of invalid records)
+    """
+    if pd.api.types.is_numeric_dtype(amounts):
+        return amounts.fillna(0.0).to_numpy(dtype=np.float64), np.zeros(len(amounts), dtype=bool)
+    
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                sales_data.append(row)
-        print(f"✓ Successfully loaded {len(sales_data)} sales records from {filename}")
-    except FileNotFoundError:
-        print(f"✗ Error: File '{filename}' not found.")
-        sys.exit(1)
-    except Exception as e:
-        print(f"✗ Error loading sales data: {e}")
-        sys.exit(1)
+        values = pc.cast(pa.array(amounts, type=pa.string(), from_pandas=True), pa.float64())
+        return values.fill_null(0.0).to_numpy(), np.zeros(len(amounts), dtype=bool)
+    except pa.ArrowInvalid:
+        values = pd.to_numeric(amounts, errors='coerce')
+        invalid = (values.isna() & amounts.notna()).to_numpy()
+        return values.fillna(0.0).to_numpy(dtype=np.float64), invalid
+
+
+def calculate_taxes(sales_chunk):
+    """
+    Calculate taxes for a chunk of sales records.
+    
+    Taxes are computed column-wise over the whole chunk rather than
+    record by record. Records with an invalid amount are reported and dropped.
+    
+    Args:
+        sales_chunk (pandas.DataFrame): Sales records
+        
+    Returns:
+        pandas.DataFrame: Processed records with tax_rate, tax_amount and total_amount columns
+    """
+    # Columns absent from the file are either missing or read as all nulls
+    for column, default in SALES_DEFAULTS.items():
+        if column not in sales_chunk:
+            sales_chunk[column] = default
+        elif column == 'transaction_id' and sales_chunk[column].hasnans:
+            sales_chunk[column] = sales_chunk[column].fillna(default)
+    
+    amounts, invalid = parse_amounts(sales_chunk['amount'])
+    if invalid.any():
+        for transaction_id in sales_chunk['transaction_id'][invalid]:
+            print(f"✗ Error processing record {transaction_id}: invalid amount")
+        sales_chunk = sales_chunk[~invalid]
+        amounts = amounts[~invalid]
+    
+    categories = sales_chunk['category'].astype('category')
+    if categories.hasnans:
+        default = SALES_DEFAULTS['category']
+        if default not in categories.cat.categories:
+            categories = categories.cat.add_categories(default)
+        categories = categories.fillna(default)
+    
+    # Output columns are sized once for the chunk and filled in place, and
+    # the DataFrame wraps them without copying
+    record_count = len(amounts)
+    rates = np.empty(record_count, dtype=np.float64)
+    tax = np.empty(record_count, dtype=np.float64)
+    totals = np.empty(record_count, dtype=np.float64)
+    np.take(TAX_RATES_ARRAY, category_codes(categories), out=rates)
+    np.multiply(amounts, rates, out=tax)
+    np.add(amounts, tax, out=totals)
+    
+    return pd.DataFrame({
+        'transaction_id': sales_chunk['transaction_id'].to_numpy(),
+        'amount': amounts,
+        'category': categories.array,
+        'tax_rate': rates,
+        'tax_amount': tax,
+        'total_amount': totals,
+    }, copy=False)
+
+
+def _process_chunk(sales_chunk, verbose=False):
+    """
+    Calculate taxes for one chunk and reduce it to partial totals.
+    
+    Runs in a worker process, so it must stay a module-level function.
+    
+    Args:
+        sales_chunk (pandas.DataFrame): Sales records
+        verbose (bool): Also format a line per transaction
+        
+    Returns:
+        tuple: (summary, lines) where summary holds count, sales and tax per category
+    """
+    processed = calculate_taxes(sales_chunk)
     
-    return sales_data
+    summary = processed.groupby('category', observed=True).agg(
+        count=('amount', 'size'), sales=('amount', 'sum'), tax=('tax_amount', 'sum'))
+    # Chunks see different category sets, so drop the categorical index before combining
+    summary.index = summary.index.astype(str)
+    
+    lines = []
+    if verbose:
+        lines = [f"Transaction {tid}: ${a:.2f} + ${t:.2f} tax = ${total:.2f}"
+                 for tid, a, t, total in zip(processed['transaction_id'], processed['amount'],
+                                             processed['tax_amount'], processed['total_amount'])]
+    
+    return summary, lines
 
 
-def process_sales(sales_data):
+def _iter_partials(sales_data, process_chunk, workers=None, ordered=False):
+    """
+    Apply process_chunk to every chunk, in worker processes unless workers is 1.
+    
+    Args:
+        sales_data (iterable): Chunks of sales records
+        process_chunk (callable): Picklable per-chunk function
+        workers (int): Number of worker processes, defaults to the CPU count
+        ordered (bool): Yield results in chunk order
+        
+    Yields:
+        Results of process_chunk, one per chunk
+    """
+    if workers == 1:
+        yield from map(process_chunk, sales_data)
+        return
+    
+    with multiprocessing.Pool(workers or os.cpu_count()) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        yield from imap(process_chunk, sales_data)
+
+
+def process_sales(sales_data, output=None, workers=None):
     """
     Process sales data and calculate taxes.
     
+    Chunks are processed in parallel into per-category partial sums, which
+    are combined here with a single groupby, so only the aggregates are
+    kept in memory.
+    
     Args:
-        sales_data (list): List of sales records
+        sales_data (iterable): Chunks of sales records as DataFrames
+        output (file): Text stream for per-transaction lines, None to skip them
+        workers (int): Number of worker processes, defaults to the CPU count
         
     Returns:
-        tuple: (processed_records, total_sales, total_tax)
+        tuple: (category_summary, total_sales, total_tax)
     """
-    calculator = TaxCalculator()
-    processed_records = []
-    total_sales = 0.0
-    total_tax = 0.0
+    partials = []
     
     print("\n" + "="*80)
     print("Processing Sales Transactions")
     print("="*80)
     
-    for record in sales_data:
-        try:
-            transaction_id = record.get('transaction_id', 'N/A')
-            amount = float(record.get('amount', 0))
-            category = record.get('category', 'standard')
-            
-            # Calculate tax for this transaction
-            tax_amount = calculator.calculate_tax(amount, category)
-            total_amount = amount + tax_amount
-            
-            # Store processed record
-            processed_record = {
-                'transaction_id': transaction_id,
-                'amount': amount,
-                'category': category,
-                'tax_rate': TAX_RATES.get(category, TAX_RATES['standard']),
-                'tax_amount': tax_amount,
-                'total_amount': total_amount
-            }
-            processed_records.append(processed_record)
-            
-            # Update totals
-            total_sales += amount
-            total_tax += tax_amount
-            
-            # Display transaction details
-            print(f"Transaction {transaction_id}: ${amount:.2f} + ${tax_amount:.2f} tax = ${total_amount:.2f}")
-            
-        except (ValueError, KeyError) as e:
-            print(f"✗ Error processing record {record.get('transaction_id', 'unknown')}: {e}")
-            continue
-    
-    return processed_records, total_sales, total_tax
-
-
-def generate_report(processed_records, total_sales, total_tax):
+    verbose = output is not None
+    process_chunk = partial(_process_chunk, verbose=verbose)
+    for summary, lines in _iter_partials(sales_data, process_chunk, workers, ordered=verbose):
+        partials.append(summary)
+        
+        # One write per chunk instead of one print per transaction
+        if lines:
+            output.write("\n".join(lines) + "\n")
+    
+    if not partials:
+        return pd.DataFrame(columns=['count', 'sales', 'tax']), 0.0, 0.0
+    
+    category_summary = pd.concat(partials).groupby(level=0).sum()
+    return category_summary, float(category_summary['sales'].sum()), float(category_summary['tax'].sum())
+
+
+def generate_report(category_summary, total_sales, total_tax):
     """
     Generate and display tax calculation report.
     
     Args:
-        processed_records (list): List of processed sales records
+        category_summary (pandas.DataFrame): count, sales and tax per category
         total_sales (float): Total sales amount before tax
         total_tax (float): Total tax amount
     """
     total_revenue = total_sales + total_tax
+    transaction_count = int(category_summary['count'].sum())
     
     print("\n" + "="*80)
     print("TAX CALCULATION REPORT")
     print("="*80)
     print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"\nTotal Transactions: {len(processed_records)}")
+    print(f"\nTotal Transactions: {transaction_count}")
     print(f"Total Sales (pre-tax): ${total_sales:,.2f}")
     print(f"Total Tax Collected: ${total_tax:,.2f}")
     print(f"Total Revenue: ${total_revenue:,.2f}")
@@ -119,18 +262,9 @@ def generate_report(processed_records, total_sales, total_tax):
     print("Category Breakdown:")
     print("-"*80)
     
-    categories = {}
-    for record in processed_records:
-        cat = record['category']
-        if cat not in categories:
-            categories[cat] = {'count': 0, 'sales': 0, 'tax': 0}
-        categories[cat]['count'] += 1
-        categories[cat]['sales'] += record['amount']
-        categories[cat]['tax'] += record['tax_amount']
-    
-    for category, data in sorted(categories.items()):
+    for category, data in category_summary.sort_index().iterrows():
         print(f"\n{category.upper()}:")
-        print(f"  Transactions: {data['count']}")
+        print(f"  Transactions: {int(data['count'])}")
         print(f"  Sales: ${data['sales']:,.2f}")
         print(f"  Tax: ${data['tax']:,.2f}")
         print(f"  Rate: {TAX_RATES.get(category, 0)*100:.1f}%")
@@ -138,10 +272,38 @@ def generate_report(processed_records, total_sales, total_tax):
     print("\n" + "="*80)
 
 
-def main():
+def parse_args(argv=None):
+    """
+    Parse command-line arguments.
+    
+    Args:
+        argv (list): Argument list, defaults to sys.argv[1:]
+        
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Tax Master - Tax Calculation System")
+    parser.add_argument('filename', nargs='?', default='sales_data.csv',
+                        help="CSV file containing sales data (default: sales_data.csv)")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="print every processed transaction")
+    parser.add_argument('--report', metavar='FILE',
+                        help="write every processed transaction to FILE instead of stdout")
+    parser.add_argument('--chunksize', type=int, default=CHUNK_SIZE,
+                        help=f"rows read per chunk (default: {CHUNK_SIZE})")
+    parser.add_argument('--force-reparse', action='store_true',
+                        help="parse the CSV file even if an up-to-date Parquet cache exists")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes for tax calculation (default: CPU count)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """
     Main function to run the Tax Master application.
     """
+    args = parse_args(argv)
+    
     print("\n" + "="*80)
     print("TAX MASTER - Tax Calculation System")
     print("="*80)
@@ -149,18 +311,42 @@ def main():
     print("Author: palyam123")
     print("="*80 + "\n")
     
-    # Load sales data
-    sales_data = load_sales_data('sales_data.csv')
+    # Stream sales data and calculate taxes chunk by chunk
+    try:
+        sales_data = load_sales_data(args.filename, chunksize=args.chunksize,
+                                     column_types=SALES_COLUMN_TYPES,
+                                     force_reparse=args.force_reparse,
+                                     columns=list(SALES_COLUMN_TYPES))
+        print(f"✓ Successfully opened {args.filename}")
+    except FileNotFoundError:
+        print(f"✗ Error: File '{args.filename}' not found.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"✗ Error loading sales data: {e}")
+        sys.exit(1)
+    
+    with contextlib.ExitStack() as stack:
+        output = sys.stdout if args.verbose else None
+        if args.report:
+            output = stack.enter_context(
+                open(args.report, 'w', encoding='utf-8', buffering=REPORT_BUFFER_SIZE))
+        try:
+            category_summary, total_sales, total_tax = process_sales(
+                sales_data, output=output, workers=args.workers)
+        except Exception as e:
+            # Any failure while reading or processing a chunk ends the run
+            print(f"✗ Error processing sales data: {e}")
+            sys.exit(1)
     
-    if not sales_data:
+    if args.report:
+        print(f"✓ Transaction details written to {args.report}")
+    
+    if category_summary.empty:
         print("\n✗ No sales data to process.")
         return
     
-    # Process sales and calculate taxes
-    processed_records, total_sales, total_tax = process_sales(sales_data)
-    
     # Generate comprehensive report
-    generate_report(processed_records, total_sales, total_tax)
+    generate_report(category_summary, total_sales, total_tax)
     
     print("\n✓ Tax calculation completed successfully!\n")
 
@@ -10,13 +10,98 @@ The module also provides functions to manage tax structures and apply them to sa
 """
 
 import csv
+import functools
+import itertools
+import json
 import os
+import types
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+try:
+    from numba import njit, prange
+    from numba import types as numba_types
+except ImportError:  # numba is optional; NumPy is used instead
+    njit = None
+    prange = range
 
 
 # Tax rate constants
 INDIA_TAX_RATE = 0.10  # 10% tax rate for items > 2000 in India
 INDIA_TAX_THRESHOLD = 2000  # Items with rate <= 2000 are tax-exempt in India
 
+# Category tax rates for transaction-level sales data; unknown categories
+# fall back to 'standard'. Read-only, since rate lookups are cached
+TAX_RATES = types.MappingProxyType({
+    'standard': 0.10,
+    'reduced': 0.05,
+    'zero': 0.00,
+})
+
+# Fixed category ordering, so hot loops can index a contiguous rate array
+# by integer category code instead of looking names up in TAX_RATES
+TAX_CATEGORIES = tuple(TAX_RATES)
+TAX_CATEGORY_CODES = types.MappingProxyType(
+    {category: code for code, category in enumerate(TAX_CATEGORIES)})
+TAX_RATES_ARRAY = np.array([TAX_RATES[category] for category in TAX_CATEGORIES], dtype=np.float64)
+TAX_RATES_ARRAY.flags.writeable = False
+
+# Rows per chunk when streaming a CSV; large enough to amortize per-chunk
+# overhead while keeping peak memory bounded
+CHUNK_SIZE = 500_000
+
+# Parquet schema metadata key identifying the cached CSV and its parse options
+CACHE_METADATA_KEY = b'tax_master.source'
+
+# Column types applied when parsing item-level sales data. The numeric
+# columns are typed explicitly because the streaming reader would otherwise
+# infer them from the first block only
+ITEM_COLUMN_TYPES = {
+    'Country Code': pa.dictionary(pa.int32(), pa.string()),
+    'Item Rate': pa.float64(),
+    'Item Quantity': pa.float64(),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _rate_for(category):
+    """
+    Look up the tax rate for a category, memoized per category name.
+    
+    Args:
+        category (str): Product category
+    
+    Returns:
+        float: Tax rate, the 'standard' rate for unknown categories
+    """
+    return TAX_RATES.get(category, TAX_RATES['standard'])
+
+
+class TaxCalculator:
+    """
+    Scalar tax calculator for transaction-level sales records.
+    
+    Prefer the vectorized pipeline in main.py for bulk data; this is for
+    callers that work one record at a time.
+    """
+    
+    def calculate_tax(self, amount, category):
+        """
+        Calculate tax for a single transaction.
+        
+        Args:
+            amount (float): Transaction amount before tax
+            category (str): Product category
+        
+        Returns:
+            float: Tax amount, unrounded
+        """
+        return amount * _rate_for(category)
+
 
 def calculate_tax_amount(item_rate, item_quantity, country_code):
     """
@@ -29,10 +114,10 @@ def calculate_tax_amount(item_rate, item_quantity, country_code):
     Args:
         item_rate (float): Rate per unit of the item
         item_quantity (int): Quantity of items
-        country_code (str): Country code (e.g., 'INDIA', 'USA', 'UK')
+        country_code (str): Country code in any case (e.g., 'INDIA', 'USA', 'UK')
     
     Returns:
-        float: Calculated tax amount
+        float: Calculated tax amount, unrounded
     """
     item_amount = item_rate * item_quantity
     
@@ -47,7 +132,109 @@ def calculate_tax_amount(item_rate, item_quantity, country_code):
         # All items are tax-exempt for countries other than India
         tax_amount = 0.0
     
-    return round(tax_amount, 2)
+    return tax_amount
+
+
+def _is_india(country_codes):
+    """
+    Build a boolean mask of items sold in INDIA.
+    
+    Args:
+        country_codes (numpy.ndarray or pandas.Categorical): Country code of each item
+    
+    Returns:
+        numpy.ndarray: True where the country code is INDIA, in any case
+    """
+    if isinstance(country_codes, pd.Series):
+        country_codes = country_codes.array
+    
+    if isinstance(country_codes, pd.Categorical):
+        # Compare each distinct country once, then map rows by integer code;
+        # the trailing False covers missing values (code -1)
+        india_categories = np.char.upper(np.asarray(country_codes.categories, dtype='U')) == 'INDIA'
+        is_india = np.append(india_categories, False)[country_codes.codes]
+    else:
+        is_india = np.char.upper(np.asarray(country_codes).astype('U')) == 'INDIA'
+    return is_india
+
+
+def _is_india_taxable(item_rates, country_codes):
+    """
+    Build a boolean mask of items taxable under the INDIA rule.
+    
+    Args:
+        item_rates (numpy.ndarray): Rate per unit of each item
+        country_codes (numpy.ndarray or pandas.Categorical): Country code of each item
+    
+    Returns:
+        numpy.ndarray: True where the item is taxable
+    """
+    return _is_india(country_codes) & (np.asarray(item_rates) > INDIA_TAX_THRESHOLD)
+
+
+def _tax_kernel(item_rates, item_quantities, is_india, out):
+    """
+    Fill out with the INDIA tax for each item; compiled by _compiled_tax_kernel.
+    """
+    for i in prange(item_rates.shape[0]):
+        if is_india[i] and item_rates[i] > INDIA_TAX_THRESHOLD:
+            out[i] = item_rates[i] * item_quantities[i] * INDIA_TAX_RATE
+        else:
+            out[i] = 0.0
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_tax_kernel():
+    """
+    Compile _tax_kernel with Numba for a fixed signature on first use.
+    
+    The compiled code is cached on disk, so later runs only load it.
+    Compiling lazily rather than at import keeps Numba's parallel threading
+    layer from starting in processes that never use it; processes forked
+    after it has started (such as multiprocessing workers) can hang on exit.
+    
+    Returns:
+        callable: Compiled kernel, or None if numba is not installed
+    """
+    if njit is None:
+        return None
+    # Inputs are declared read-only with any layout, so copy-on-write views
+    # and strided slices from pandas are accepted without a copy
+    rates = numba_types.Array(numba_types.float64, 1, 'A', readonly=True)
+    quantities = numba_types.Array(numba_types.float64, 1, 'A', readonly=True)
+    is_india = numba_types.Array(numba_types.uint8, 1, 'A', readonly=True)
+    out = numba_types.Array(numba_types.float64, 1, 'A')
+    return njit(numba_types.void(rates, quantities, is_india, out),
+                parallel=True, cache=True)(_tax_kernel)
+
+
+def calculate_tax_amount_vec(item_rates, item_quantities, country_codes):
+    """
+    Calculate tax amounts for arrays of items in one pass.
+    
+    Applies the same rules as calculate_tax_amount element-wise. Uses a
+    compiled Numba kernel when numba is installed.
+    
+    Args:
+        item_rates (numpy.ndarray): Rate per unit of each item
+        item_quantities (numpy.ndarray): Quantity of each item
+        country_codes (numpy.ndarray): Country code of each item
+    
+    Returns:
+        numpy.ndarray: Calculated tax amount per item
+    """
+    item_rates = np.asarray(item_rates, dtype=np.float64)
+    
+    tax_kernel = _compiled_tax_kernel()
+    if tax_kernel is not None:
+        tax_amounts = np.empty_like(item_rates)
+        tax_kernel(item_rates, np.asarray(item_quantities, dtype=np.float64),
+                    _is_india(country_codes).view(np.uint8), tax_amounts)
+        return tax_amounts
+    
+    item_amounts = item_rates * np.asarray(item_quantities)
+    taxable = _is_india_taxable(item_rates, country_codes)
+    return np.where(taxable, item_amounts * INDIA_TAX_RATE, 0.0)
 
 
 def calculate_total_amount(item_rate, item_quantity, tax_amount):
@@ -63,8 +250,11 @@ def calculate_total_amount(item_rate, item_quantity, tax_amount):
         float: Total amount (item amount + tax amount)
     """
     item_amount = item_rate * item_quantity
-    total_amount = item_amount + tax_amount
-    return round(total_amount, 2)
+    return item_amount + tax_amount
+
+
+# Status labels, indexed by the taxable flag
+TAX_STATUSES = ('Tax-Exempt', 'Taxable')
 
 
 def get_tax_status(item_rate, country_code):
@@ -73,7 +263,7 @@ def get_tax_status(item_rate, country_code):
     
     Args:
         item_rate (float): Rate per unit of the item
-        country_code (str): Country code
+        country_code (str): Country code in any case
     
     Returns:
         str: 'Taxable' or 'Tax-Exempt'
@@ -87,6 +277,21 @@ def get_tax_status(item_rate, country_code):
         return 'Tax-Exempt'
 
 
+def get_tax_status_vec(item_rates, country_codes):
+    """
+    Determine taxable or tax-exempt status for arrays of items.
+    
+    Args:
+        item_rates (numpy.ndarray): Rate per unit of each item
+        country_codes (numpy.ndarray): Country code of each item
+    
+    Returns:
+        pandas.Categorical: 'Taxable' or 'Tax-Exempt' per item, stored as one-byte codes
+    """
+    taxable = _is_india_taxable(np.asarray(item_rates, dtype=np.float64), country_codes)
+    return pd.Categorical.from_codes(taxable.astype(np.int8), TAX_STATUSES)
+
+
 def update_sales_record_with_tax(record):
     """
     Update a sales record with calculated tax information.
@@ -105,7 +310,7 @@ def update_sales_record_with_tax(record):
         country_code = record['Country Code']
         
         # Calculate amounts
-        item_amount = round(item_rate * item_quantity, 2)
+        item_amount = item_rate * item_quantity
         tax_amount = calculate_tax_amount(item_rate, item_quantity, country_code)
         total_amount = calculate_total_amount(item_rate, item_quantity, tax_amount)
         
@@ -120,57 +325,358 @@ def update_sales_record_with_tax(record):
         return None
 
 
-def load_sales_data(filename='sales_data.csv'):
+def update_sales_frame_with_tax(sales_data):
+    """
+    Add calculated tax columns to a DataFrame of sales records.
+    
+    Columnar counterpart of update_sales_record_with_tax: every column is
+    computed as one array operation instead of one dict per record.
+    
+    Args:
+        sales_data (pandas.DataFrame): Sales records with columns
+                                       'Country Code', 'Item Rate', 'Item Quantity'
+    
+    Returns:
+        pandas.DataFrame: The same frame with 'Item Amount', 'Tax Amount' and
+                          'Total Amount' columns, or None if a column is missing or
+                          invalid (including fractional quantities)
+    """
+    try:
+        item_rates = pd.to_numeric(sales_data['Item Rate']).to_numpy(dtype=np.float64)
+        item_quantities = pd.to_numeric(sales_data['Item Quantity']).to_numpy(dtype=np.float64)
+        # Quantities are whole units, as int() enforces in update_sales_record_with_tax
+        if not np.array_equal(item_quantities, np.trunc(item_quantities)):
+            raise ValueError("Item Quantity must be a whole number")
+        item_quantities = item_quantities.astype(np.int64)
+        country_codes = sales_data['Country Code']
+    except (KeyError, ValueError) as e:
+        print(f"Error processing records: {e}")
+        return None
+    
+    item_amounts = item_rates * item_quantities
+    tax_amounts = calculate_tax_amount_vec(item_rates, item_quantities, country_codes)
+    
+    sales_data['Item Amount'] = item_amounts
+    sales_data['Tax Amount'] = tax_amounts
+    sales_data['Total Amount'] = item_amounts + tax_amounts
+    
+    return sales_data
+
+
+def _iter_tables(batches, chunksize):
+    """
+    Regroup Arrow record batches into tables of at least chunksize rows.
+    
+    Args:
+        batches (iterable): pyarrow.RecordBatch objects
+        chunksize (int): Minimum number of rows per table
+    
+    Yields:
+        pyarrow.Table: Consecutive batches combined
+    """
+    pending = []
+    rows = 0
+    for batch in batches:
+        pending.append(batch)
+        rows += batch.num_rows
+        if rows >= chunksize:
+            yield pa.Table.from_batches(pending)
+            pending = []
+            rows = 0
+    if pending:
+        yield pa.Table.from_batches(pending)
+
+
+def _discard_cache(writer, partial_path, error):
+    """
+    Abandon a Parquet cache that could not be written.
+    
+    Args:
+        writer (pyarrow.parquet.ParquetWriter): Open writer, or None if it never opened
+        partial_path (str): Partial cache file the writer was writing to
+        error (Exception): Reason the cache is being dropped
+    """
+    print(f"Warning: Not caching parsed sales data: {error}")
+    if writer is None:
+        return
+    try:
+        writer.close()
+        os.remove(partial_path)
+    except (OSError, pa.ArrowException):
+        pass
+
+
+def _read_chunks(source, batches, chunksize, cache_path=None, cache_key=None):
+    """
+    Convert Arrow record batches into DataFrame chunks of at least chunksize rows.
+    
+    When cache_path is given, the chunks are also written to a Parquet file
+    tagged with cache_key, which only replaces cache_path once the whole
+    input has been read. Failing to write the cache only prints a warning;
+    the chunks are still yielded.
+    
+    Args:
+        source: Open file (memory map or Parquet file), closed once reading ends
+        batches (iterable): pyarrow.RecordBatch objects read from source
+        chunksize (int): Minimum number of rows per chunk
+        cache_path (str): Parquet file to write the parsed data to, or None
+        cache_key (bytes): Key of the source and parse options stored in the cache metadata
+    
+    Yields:
+        pandas.DataFrame: Chunk of sales records
+    """
+    writer = None
+    partial_path = f"{cache_path}.partial"
+    completed = False
+    try:
+        for table in _iter_tables(batches, chunksize):
+            if cache_path is not None:
+                try:
+                    if writer is None:
+                        schema = table.schema.with_metadata(
+                            {**(table.schema.metadata or {}), CACHE_METADATA_KEY: cache_key})
+                        writer = pq.ParquetWriter(partial_path, schema, compression='zstd')
+                    writer.write_table(table)
+                except (OSError, pa.ArrowException) as e:
+                    _discard_cache(writer, partial_path, e)
+                    writer = None
+                    cache_path = None
+            yield table.to_pandas()
+        completed = True
+    finally:
+        if writer is not None:
+            try:
+                writer.close()
+                if completed:
+                    os.replace(partial_path, cache_path)
+                else:
+                    os.remove(partial_path)
+            except (OSError, pa.ArrowException) as e:
+                _discard_cache(None, partial_path, e)
+        source.close()
+
+
+def sales_cache_path(filename):
+    """
+    Return the Parquet cache file used for a sales CSV file.
+    
+    The name is hidden and specific to this cache, so it never collides
+    with a user's own Parquet file next to the CSV.
+    
+    Args:
+        filename (str): Path to the CSV file
+    
+    Returns:
+        str: Path of the cache file next to it
+    """
+    directory, name = os.path.split(filename)
+    return os.path.join(directory, f".{os.path.splitext(name)[0]}.taxcache.parquet")
+
+
+def _cache_key(filename, column_types, columns=None):
+    """
+    Identify a CSV file and the options it is parsed with.
+    
+    The key covers the file's size and modification time, every
+    requested column type and the selected columns, so callers parsing the
+    same file differently never read each other's cache.
+    
+    Args:
+        filename (str): Path to the CSV file
+        column_types (dict): pyarrow types the caller asked for
+        columns (list): Columns the caller selected, None for all
+    
+    Returns:
+        bytes: Key stored in, and compared against, the cache metadata
+    """
+    stat = os.stat(filename)
+    options = {name: str(column_type) for name, column_type in column_types.items()}
+    return json.dumps({'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                       'column_types': options, 'columns': columns and list(columns)},
+                      sort_keys=True).encode()
+
+
+def _cache_is_fresh(cache_path, cache_key):
+    """
+    Check whether a Parquet cache can stand in for parsing the CSV file.
+    
+    Args:
+        cache_path (str): Path to the Parquet cache
+        cache_key (bytes): Current key of the CSV file and parse options
+    
+    Returns:
+        bool: True if the cache was written from this exact CSV with the same options
+    """
+    if not os.path.exists(cache_path):
+        return False
+    try:
+        schema = pq.read_schema(cache_path)
+    except (OSError, pa.ArrowException):
+        return False
+    return (schema.metadata or {}).get(CACHE_METADATA_KEY) == cache_key
+
+
+def load_sales_data(filename='sales_data.csv', chunksize=CHUNK_SIZE, column_types=None,
+                    force_reparse=False, columns=None):
     """
-    Load sales data from CSV file.
+    Load sales data from CSV file in chunks.
+    
+    The parsed data is cached as Parquet next to the CSV file. When the
+    cache was written from the CSV's current size and modification time,
+    with the same column types, it is read instead, skipping CSV parsing.
+    Otherwise the file is memory-mapped and tokenized by pyarrow's streaming
+    CSV reader straight from the mapped pages. Errors are raised rather
+    than reported: a missing file or a bad first block fails here, later
+    parse errors while iterating over the chunks.
     
     Args:
         filename (str): Path to the CSV file
+        chunksize (int): Minimum number of rows per chunk
+        column_types (dict): pyarrow types for selected columns, the rest are inferred
+        force_reparse (bool): Parse the CSV even if an up-to-date cache exists
+        columns (list): Only parse these columns, reading any the file lacks as
+                        nulls; None parses every column
     
     Returns:
-        list: List of sales records as dictionaries
+        iterator: pandas.DataFrame chunks of sales records
     """
-    sales_data = []
+    column_types = column_types or {}
+    cache_path = sales_cache_path(filename)
+    cache_key = _cache_key(filename, column_types, columns)
+    
+    if not force_reparse and _cache_is_fresh(cache_path, cache_key):
+        parquet_file = pq.ParquetFile(cache_path, memory_map=True)
+        return _read_chunks(parquet_file, parquet_file.iter_batches(batch_size=chunksize), chunksize)
     
+    source = pa.memory_map(filename, 'r')
+    try:
+        convert_options = pacsv.ConvertOptions(column_types=column_types)
+        if columns is not None:
+            convert_options.include_columns = list(columns)
+            convert_options.include_missing_columns = True
+        reader = pacsv.open_csv(source, convert_options=convert_options)
+    except Exception:
+        source.close()
+        raise
+    
+    return _read_chunks(source, reader, chunksize, cache_path=cache_path, cache_key=cache_key)
+
+
+def load_sales_frame(filename='sales_data.csv'):
+    """
+    Load sales data from CSV file into a single DataFrame.
+    
+    Country Code is dictionary-encoded, so each distinct country string is
+    stored once and rows hold small integer codes, so the tax functions
+    compare each distinct country once rather than once per row.
+    
+    Args:
+        filename (str): Path to the CSV file
+    
+    Returns:
+        pandas.DataFrame: Sales records, empty if the file could not be read
+    """
     if not os.path.exists(filename):
         print(f"Warning: File '{filename}' not found.")
-        return sales_data
+        return pd.DataFrame()
     
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                sales_data.append(row)
+        chunks = list(load_sales_data(filename, column_types=ITEM_COLUMN_TYPES))
+        sales_data = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+        if 'Item Quantity' in sales_data:
+            quantities = sales_data['Item Quantity'].to_numpy()
+            # Whole-number quantities are written back out as integers
+            if np.array_equal(quantities, np.trunc(quantities)):
+                sales_data['Item Quantity'] = quantities.astype(np.int64)
         print(f"Successfully loaded {len(sales_data)} records from {filename}")
     except Exception as e:
         print(f"Error loading sales data: {e}")
+        return pd.DataFrame()
     
     return sales_data
 
 
+def iter_sales_data(filename='sales_data.csv', chunksize=10_000):
+    """
+    Read sales data from CSV file in chunks without loading the whole file.
+    
+    Args:
+        filename (str): Path to the CSV file
+        chunksize (int): Maximum number of records per chunk
+    
+    Yields:
+        list: Sales records as dictionaries, at most chunksize per chunk
+    """
+    if not os.path.exists(filename):
+        print(f"Warning: File '{filename}' not found.")
+        return
+    
+    with open(filename, 'r', encoding='utf-8') as file:
+        reader = csv.DictReader(file)
+        while True:
+            chunk = list(itertools.islice(reader, chunksize))
+            if not chunk:
+                break
+            yield chunk
+
+
+# Columns written by save_sales_data, in order
+SALES_FIELDNAMES = ['Transaction Date', 'Customer Name', 'Country Code', 'Item Name',
+                    'Item Rate', 'Item Quantity', 'Item Amount', 'Tax Amount', 'Total Amount']
+
+# Monetary fields, rounded to cents only when written out
+AMOUNT_FIELDS = ('Item Amount', 'Tax Amount', 'Total Amount')
+
+
+def _format_amounts(record):
+    """
+    Format calculated monetary fields of a record to two decimal places.
+    
+    Args:
+        record (dict): Sales record
+    
+    Returns:
+        dict: Copy of the record with float amounts formatted as strings
+    """
+    formatted = dict(record)
+    for field in AMOUNT_FIELDS:
+        value = formatted.get(field)
+        if isinstance(value, float):
+            formatted[field] = f"{value:.2f}"
+    return formatted
+
+
 def save_sales_data(sales_data, filename='sales_data.csv'):
     """
     Save sales data to CSV file.
     
+    DataFrames are written with pandas' columnar CSV formatter; lists of
+    record dictionaries go through csv.DictWriter. Either way, only the
+    calculated amounts are formatted to two decimal places.
+    
     Args:
-        sales_data (list): List of sales records
+        sales_data (pandas.DataFrame or list): Sales records
         filename (str): Path to the CSV file
     
     Returns:
         bool: True if successful, False otherwise
     """
-    if not sales_data:
+    if len(sales_data) == 0:
         print("No data to save.")
         return False
     
     try:
-        fieldnames = ['Transaction Date', 'Customer Name', 'Country Code', 'Item Name',
-                     'Item Rate', 'Item Quantity', 'Item Amount', 'Tax Amount', 'Total Amount']
-        
-        with open(filename, 'w', encoding='utf-8', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(sales_data)
+        if isinstance(sales_data, pd.DataFrame):
+            frame = sales_data.reindex(columns=SALES_FIELDNAMES)
+            for field in AMOUNT_FIELDS:
+                if pd.api.types.is_float_dtype(frame[field]):
+                    frame[field] = frame[field].map('{:.2f}'.format, na_action='ignore')
+            frame.to_csv(filename, index=False, encoding='utf-8')
+        else:
+            with open(filename, 'w', encoding='utf-8', newline='') as file:
+                writer = csv.DictWriter(file, fieldnames=SALES_FIELDNAMES)
+                writer.writeheader()
+                writer.writerows(_format_amounts(record) for record in sales_data)
         
         print(f"Successfully saved {len(sales_data)} records to {filename}")
         return True
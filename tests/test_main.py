@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import main
+from tax_rules import TAX_CATEGORY_CODES, TAX_RATES
+
+
+def test_parse_amounts_fast_path():
+    amounts, invalid = main.parse_amounts(pd.Series(['10.50', '2', None], dtype='str'))
+
+    np.testing.assert_array_equal(amounts, [10.5, 2.0, 0.0])
+    assert not invalid.any()
+
+
+def test_parse_amounts_numeric_column():
+    amounts, invalid = main.parse_amounts(pd.Series([1.5, np.nan, 3.0]))
+
+    np.testing.assert_array_equal(amounts, [1.5, 0.0, 3.0])
+    assert not invalid.any()
+
+
+def test_parse_amounts_lenient_fallback():
+    amounts, invalid = main.parse_amounts(pd.Series([' 1.5 ', '', 'abc', '4', None], dtype='str'))
+
+    np.testing.assert_array_equal(amounts, [1.5, 0.0, 0.0, 4.0, 0.0])
+    np.testing.assert_array_equal(invalid, [False, True, True, False, False])
+
+
+def test_category_codes_unknown_and_missing_use_standard():
+    categories = pd.Series(['reduced', 'luxury', None, 'zero'], dtype='str')
+
+    codes = main.category_codes(categories)
+
+    standard = TAX_CATEGORY_CODES['standard']
+    np.testing.assert_array_equal(
+        codes, [TAX_CATEGORY_CODES['reduced'], standard, standard, TAX_CATEGORY_CODES['zero']])
+
+
+def test_calculate_taxes_defaults_and_invalid_records(capsys):
+    sales_chunk = pd.DataFrame({
+        'transaction_id': ['T1', 'T2', 'T3', 'T4'],
+        'amount': ['100', 'x', '50', '20'],
+        'category': ['reduced', 'zero', 'luxury', None],
+    })
+
+    processed = main.calculate_taxes(sales_chunk)
+
+    assert "T2: invalid amount" in capsys.readouterr().out
+    assert list(processed['transaction_id']) == ['T1', 'T3', 'T4']
+    assert list(processed['category']) == ['reduced', 'luxury', 'standard']
+    np.testing.assert_allclose(processed['tax_rate'], [TAX_RATES['reduced'], TAX_RATES['standard'],
+                                                       TAX_RATES['standard']])
+    np.testing.assert_allclose(processed['tax_amount'], [5.0, 5.0, 2.0])
+    np.testing.assert_allclose(processed['total_amount'], [105.0, 55.0, 22.0])
+
+
+def test_calculate_taxes_missing_category_column():
+    processed = main.calculate_taxes(pd.DataFrame({'amount': ['10', '20']}))
+
+    assert list(processed['transaction_id']) == ['N/A', 'N/A']
+    np.testing.assert_allclose(processed['tax_amount'], [1.0, 2.0])
+
+
+def _sales_frame(record_count):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'transaction_id': [f"T{i}" for i in range(record_count)],
+        'amount': [f"{amount:.2f}" for amount in rng.uniform(1, 1000, record_count)],
+        'category': rng.choice(['standard', 'reduced', 'zero', 'luxury'], record_count),
+    })
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_process_sales_chunked_matches_single_chunk(workers):
+    sales_data = _sales_frame(1000)
+    chunks = [sales_data.iloc[start:start + 97].copy() for start in range(0, len(sales_data), 97)]
+
+    summary, total_sales, total_tax = main.process_sales([sales_data.copy()], workers=1)
+    chunked_summary, chunked_sales, chunked_tax = main.process_sales(chunks, workers=workers)
+
+    pd.testing.assert_frame_equal(chunked_summary.sort_index(), summary.sort_index())
+    assert chunked_sales == pytest.approx(total_sales)
+    assert chunked_tax == pytest.approx(total_tax)
+    assert int(summary['count'].sum()) == len(sales_data)
+
+
+def test_process_sales_writes_transaction_lines(tmp_path):
+    report_path = tmp_path / 'report.txt'
+
+    with open(report_path, 'w', encoding='utf-8') as output:
+        main.process_sales([_sales_frame(10)], output=output, workers=1)
+
+    lines = report_path.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 10
+    assert lines[0].startswith("Transaction T0: $")
@@ -0,0 +1,179 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import tax_rules
+
+
+def test_calculate_tax_amount_vec_accepts_read_only_arrays():
+    item_rates = np.array([2500.5, 1500.0, 3000.0])
+    item_rates.flags.writeable = False
+    item_quantities = np.array([1, 2, 1])
+    country_codes = np.array(['INDIA', 'INDIA', 'USA'])
+
+    tax_amounts = tax_rules.calculate_tax_amount_vec(item_rates, item_quantities, country_codes)
+
+    np.testing.assert_allclose(tax_amounts, [250.05, 0.0, 0.0])
+
+
+def test_update_sales_frame_with_tax_fractional_rates():
+    sales_data = pd.DataFrame({
+        'Country Code': pd.Categorical(['INDIA', 'INDIA']),
+        'Item Rate': [2500.5, 1999.5],
+        'Item Quantity': [2, 1],
+    })
+
+    updated = tax_rules.update_sales_frame_with_tax(sales_data)
+
+    np.testing.assert_allclose(updated['Tax Amount'], [500.1, 0.0])
+    np.testing.assert_allclose(updated['Total Amount'], [5501.1, 1999.5])
+
+
+def test_calculate_tax_amount_vec_matches_scalar_rules():
+    rng = np.random.default_rng(0)
+    item_rates = rng.uniform(100, 5000, 100_000)
+    item_quantities = rng.integers(1, 10, 100_000)
+    country_codes = rng.choice(['INDIA', 'USA'], 100_000)
+
+    tax_amounts = tax_rules.calculate_tax_amount_vec(item_rates, item_quantities, country_codes)
+
+    taxable = (country_codes == 'INDIA') & (item_rates > tax_rules.INDIA_TAX_THRESHOLD)
+    expected = np.where(taxable, item_rates * item_quantities * tax_rules.INDIA_TAX_RATE, 0.0)
+    np.testing.assert_array_equal(tax_amounts, expected)
+
+
+def _write_sales_csv(path):
+    path.write_text('transaction_id,amount,category\nT1,100.00,standard\nT2,50.00,food\n')
+
+
+def test_load_sales_data_ignores_unrelated_parquet(tmp_path):
+    csv_path = tmp_path / 'sales.csv'
+    _write_sales_csv(csv_path)
+    own_parquet = tmp_path / 'sales.parquet'
+    pd.DataFrame({'other': [1, 2, 3]}).to_parquet(own_parquet)
+    before = own_parquet.read_bytes()
+
+    for _ in range(2):
+        chunks = list(tax_rules.load_sales_data(str(csv_path)))
+        assert list(pd.concat(chunks)['transaction_id']) == ['T1', 'T2']
+
+    assert own_parquet.read_bytes() == before
+    assert os.path.exists(tax_rules.sales_cache_path(str(csv_path)))
+
+
+def test_load_sales_data_survives_cache_write_failure(tmp_path):
+    csv_path = tmp_path / 'sales.csv'
+    _write_sales_csv(csv_path)
+    os.mkdir(tax_rules.sales_cache_path(str(csv_path)) + '.partial')
+
+    chunks = list(tax_rules.load_sales_data(str(csv_path)))
+
+    assert list(pd.concat(chunks)['transaction_id']) == ['T1', 'T2']
+    assert not os.path.exists(tax_rules.sales_cache_path(str(csv_path)))
+
+
+def test_scalar_tax_functions_ignore_country_case():
+    assert tax_rules.calculate_tax_amount(2500, 1, 'india') == 250.0
+    assert tax_rules.get_tax_status(2500, 'India') == 'Taxable'
+    np.testing.assert_allclose(
+        tax_rules.calculate_tax_amount_vec(np.array([2500.0]), np.array([1]), np.array(['india'])),
+        [tax_rules.calculate_tax_amount(2500, 1, 'india')])
+
+    record = tax_rules.update_sales_record_with_tax(
+        {'Country Code': 'india', 'Item Rate': '2500', 'Item Quantity': '1'})
+
+    assert record['Tax Amount'] == 250.0
+
+
+def test_update_sales_frame_with_tax_rejects_fractional_quantities():
+    sales_data = pd.DataFrame({
+        'Country Code': ['INDIA', 'INDIA'],
+        'Item Rate': [2500.0, 3000.0],
+        'Item Quantity': [1.5, 2.0],
+    })
+
+    assert tax_rules.update_sales_frame_with_tax(sales_data) is None
+
+
+def test_save_sales_data_formats_only_amounts(tmp_path):
+    record = {
+        'Transaction Date': '2024-01-01', 'Customer Name': 'A', 'Country Code': 'INDIA',
+        'Item Name': 'Laptop', 'Item Rate': 2500.125, 'Item Quantity': 1.5,
+        'Item Amount': 3750.1875, 'Tax Amount': 375.01875, 'Total Amount': 4125.20625,
+    }
+    unpriced = {
+        'Transaction Date': '2024-01-02', 'Customer Name': 'B', 'Country Code': 'USA',
+        'Item Name': 'Phone', 'Item Rate': 999.5, 'Item Quantity': 2.0,
+    }
+
+    for records in ([record, unpriced], [unpriced]):
+        frame_path = tmp_path / 'frame.csv'
+        records_path = tmp_path / 'records.csv'
+
+        assert tax_rules.save_sales_data(pd.DataFrame(records), str(frame_path))
+        assert tax_rules.save_sales_data(records, str(records_path))
+
+        assert frame_path.read_text() == records_path.read_text()
+        assert '999.5,2.0,,,\n' in frame_path.read_text()
+
+    assert tax_rules.save_sales_data(pd.DataFrame([record]), str(frame_path))
+    assert '2500.125,1.5,3750.19,375.02,4125.21' in frame_path.read_text()
+
+
+def test_load_sales_data_cache_depends_on_column_types(tmp_path):
+    csv_path = tmp_path / 'sales.csv'
+    _write_sales_csv(csv_path)
+    column_types = {'amount': pa.string(), 'category': pa.dictionary(pa.int32(), pa.string())}
+
+    typed = pd.concat(tax_rules.load_sales_data(str(csv_path), column_types=column_types))
+    inferred = pd.concat(tax_rules.load_sales_data(str(csv_path)))
+    typed_again = pd.concat(tax_rules.load_sales_data(str(csv_path), column_types=column_types))
+
+    assert inferred['amount'].dtype == np.float64
+    assert not isinstance(inferred['category'].dtype, pd.CategoricalDtype)
+    assert isinstance(typed_again['category'].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(typed, typed_again)
+
+
+def test_load_sales_frame_reads_late_fractional_rate(tmp_path):
+    csv_path = tmp_path / 'items.csv'
+    rows = [f"2024-01-01,Customer {i},India,Laptop,{1000 + i % 3000},{1 + i % 5}" for i in range(60_000)]
+    rows.append("2024-01-01,Last,India,Laptop,1999.5,1")
+    csv_path.write_text('Transaction Date,Customer Name,Country Code,Item Name,Item Rate,Item Quantity\n'
+                        + '\n'.join(rows) + '\n')
+
+    sales_data = tax_rules.load_sales_frame(str(csv_path))
+
+    assert len(sales_data) == 60_001
+    assert sales_data['Item Rate'].iloc[-1] == 1999.5
+    assert sales_data['Item Quantity'].dtype == np.int64
+
+
+def test_load_sales_data_parses_only_selected_columns(tmp_path):
+    csv_path = tmp_path / 'sales.csv'
+    rows = [f"T{i},10.00,1" for i in range(80_000)] + ["TX,10.00,1.5"]
+    csv_path.write_text('transaction_id,amount,qty\n' + '\n'.join(rows) + '\n')
+
+    sales_data = pd.concat(tax_rules.load_sales_data(
+        str(csv_path), column_types={'category': pa.string()},
+        columns=['transaction_id', 'amount', 'category']))
+
+    assert list(sales_data.columns) == ['transaction_id', 'amount', 'category']
+    assert len(sales_data) == 80_001
+    assert sales_data['category'].isna().all()
+
+
+def test_loaders_keep_country_codes_as_written(tmp_path):
+    csv_path = tmp_path / 'items.csv'
+    csv_path.write_text('Transaction Date,Customer Name,Country Code,Item Name,Item Rate,Item Quantity\n'
+                        '2024-01-01,A,india,Laptop,2500,1\n2024-01-01,B,India,Laptop,2500,2\n')
+
+    records = [record for chunk in tax_rules.iter_sales_data(str(csv_path)) for record in chunk]
+    sales_data = tax_rules.update_sales_frame_with_tax(tax_rules.load_sales_frame(str(csv_path)))
+
+    assert [record['Country Code'] for record in records] == ['india', 'India']
+    assert list(sales_data['Country Code']) == ['india', 'India']
+    np.testing.assert_allclose(sales_data['Tax Amount'], [250.0, 500.0])
+    assert [tax_rules.update_sales_record_with_tax(record)['Tax Amount'] for record in records] == [250.0, 500.0]